@@ -2,7 +2,9 @@
 Headless Business Logic Agent for programmatic access.
 Enables BL integration without web interface dependencies.
 """
+import asyncio
 import logging
+from collections import defaultdict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -56,7 +58,8 @@ class BusinessLogicAgent:
     async def resolve_incident(
         self,
         incident: Incident,
-        force: bool = False
+        force: bool = False,
+        notify: bool = True
     ) -> IncidentResolutionResponse:
         """
         Resolve an incident using auto-resolution logic.
@@ -64,6 +67,7 @@ class BusinessLogicAgent:
         Args:
             incident: Incident object to resolve
             force: Force resolution even if confidence is below threshold
+            notify: Notify the incident creator on success
         
         Returns:
             IncidentResolutionResponse with resolution details
@@ -73,7 +77,7 @@ class BusinessLogicAgent:
             incident.confidence_score = 1.0
             logger.info(f"Force-resolving incident {incident.incident_id}")
         
-        response = await self.auto_resolution.resolve_incident(incident)
+        response = await self.auto_resolution.resolve_incident(incident, notify=notify)
         
         if force:
             incident.confidence_score = original_score
@@ -221,16 +225,36 @@ class BusinessLogicAgent:
         """
         Resolve multiple incidents in batch.
         
+        Incidents are resolved concurrently, bounded by
+        ``config.max_concurrent_resolutions``. Entries sharing an
+        ``incident_id`` are resolved one after another, in input order, so
+        the status check and the resolution cannot interleave. Creators of
+        the resolved incidents are notified in a single batch at the end.
+        
         Args:
             incidents: List of incidents to resolve
         
         Returns:
-            List of resolution responses
+            List of resolution responses, in the same order as ``incidents``
         """
-        responses = []
-        for incident in incidents:
-            response = await self.resolve_incident(incident)
-            responses.append(response)
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_resolutions)
+        incident_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        
+        async def _resolve(incident: Incident) -> IncidentResolutionResponse:
+            async with incident_locks[incident.incident_id], semaphore:
+                return await self.resolve_incident(incident, notify=False)
+        
+        responses = list(await asyncio.gather(*(_resolve(i) for i in incidents)))
+        
+        if self.notification_service:
+            resolved = [
+                (incident, response.resolution_steps)
+                for incident, response in zip(incidents, responses)
+                if response.success
+            ]
+            if resolved:
+                await self.notification_service.notify_auto_resolution_batch(resolved)
+        
         return responses
     
     def set_global_enabled(self, enabled: bool):
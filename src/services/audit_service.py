@@ -2,15 +2,25 @@
 Audit service - comprehensive logging of all auto-resolution actions.
 """
 import logging
+import os
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from uuid import uuid4
+from typing import List, Optional, Dict, Any, Tuple
 
 from src.models.audit import AuditLogEntry, AuditAction, AuditQuery
 
 logger = logging.getLogger(__name__)
 
 
+def _new_audit_id() -> str:
+    """Generate a random (version 4) UUID string without building a UUID object."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class AuditService:
     """
     Service for logging all auto-resolution actions in detail.
@@ -27,6 +37,39 @@ class AuditService:
         # In production, this would use a persistent data store
         # (e.g., PostgreSQL, MongoDB, Elasticsearch)
         self._audit_log: List[AuditLogEntry] = []
+        # Parallel to _audit_log; both kept sorted by timestamp in _store
+        self._timestamps: List[datetime] = []
+    
+    @property
+    def version(self) -> int:
+        """Change counter for the audit log; grows with every new entry."""
+        return len(self._audit_log)
+    
+    def _store(self, entries: List[AuditLogEntry], timestamp: datetime) -> None:
+        """
+        Insert entries sharing ``timestamp`` so the log stays sorted by time.
+        
+        Normally this is an append; if the wall clock has stepped backwards
+        the entries are placed after any existing entries with an equal or
+        earlier timestamp, keeping the real event time and insertion order
+        among ties.
+        """
+        idx = bisect_right(self._timestamps, timestamp)
+        self._audit_log[idx:idx] = entries
+        self._timestamps[idx:idx] = [timestamp] * len(entries)
+    
+    def _newest_first(self, lo: int, hi: int):
+        """
+        Yield entries in positions [lo, hi) newest first.
+        
+        Entries sharing a timestamp keep insertion order, matching a stable
+        descending sort by timestamp.
+        """
+        timestamps = self._timestamps
+        while hi > lo:
+            group_start = bisect_left(timestamps, timestamps[hi - 1], lo, hi)
+            yield from self._audit_log[group_start:hi]
+            hi = group_start
     
     async def log_entry(
         self,
@@ -54,7 +97,7 @@ class AuditService:
             Created AuditLogEntry
         """
         entry = AuditLogEntry(
-            audit_id=str(uuid4()),
+            audit_id=_new_audit_id(),
             incident_id=incident_id,
             action=action,
             timestamp=datetime.utcnow(),
@@ -65,11 +108,11 @@ class AuditService:
             error_message=error_message
         )
         
-        self._audit_log.append(entry)
+        self._store([entry], entry.timestamp)
         
         logger.info(
-            f"Audit log created: {action.value} for incident {incident_id} "
-            f"(success={success}, confidence={confidence_score})"
+            "Audit log created: %s for incident %s (success=%s, confidence=%s)",
+            action.value, incident_id, success, confidence_score
         )
         
         return entry
@@ -156,6 +199,44 @@ class AuditService:
             }
         )
     
+    async def log_notifications_sent_bulk(
+        self,
+        notifications: List[Tuple[str, str, str]]
+    ) -> List[AuditLogEntry]:
+        """
+        Log a batch of sent notifications in one write.
+        
+        Args:
+            notifications: (incident_id, recipient, notification_type) tuples
+            
+        Returns:
+            Created AuditLogEntry records, in input order
+        """
+        timestamp = datetime.utcnow()
+        entries = [
+            AuditLogEntry(
+                audit_id=_new_audit_id(),
+                incident_id=incident_id,
+                action=AuditAction.NOTIFICATION_SENT,
+                timestamp=timestamp,
+                actor="system",
+                details={
+                    "recipient": recipient,
+                    "notification_type": notification_type
+                }
+            )
+            for incident_id, recipient, notification_type in notifications
+        ]
+        
+        self._store(entries, timestamp)
+        
+        logger.info(
+            "Audit log created: %s for %d incidents",
+            AuditAction.NOTIFICATION_SENT.value, len(entries)
+        )
+        
+        return entries
+    
     async def log_kill_switch_activation(
         self,
         actor: str,
@@ -212,31 +293,38 @@ class AuditService:
         Returns:
             List of matching audit log entries
         """
-        results = self._audit_log
-        
-        # Filter by incident_id
-        if query.incident_id:
-            results = [e for e in results if e.incident_id == query.incident_id]
+        # Entries are stored in timestamp order, so the date window maps
+        # to a contiguous slice found by bisection, and walking that slice
+        # newest first (see _newest_first) avoids sorting and lets us stop
+        # as soon as the requested page is filled.
+        timestamps = self._timestamps
+        if (
+            not timestamps
+            or (query.start_date and query.start_date > timestamps[-1])
+            or (query.end_date and query.end_date < timestamps[0])
+        ):
+            return []
         
-        # Filter by action type
-        if query.action:
-            results = [e for e in results if e.action == query.action]
+        lo = bisect_left(timestamps, query.start_date) if query.start_date else 0
+        hi = bisect_right(timestamps, query.end_date) if query.end_date else len(timestamps)
         
-        # Filter by date range
-        if query.start_date:
-            results = [e for e in results if e.timestamp >= query.start_date]
+        end_idx = query.offset + query.limit
+        results = []
+        matched = 0
         
-        if query.end_date:
-            results = [e for e in results if e.timestamp <= query.end_date]
-        
-        # Sort by timestamp (newest first)
-        results.sort(key=lambda e: e.timestamp, reverse=True)
-        
-        # Apply pagination
-        start_idx = query.offset
-        end_idx = start_idx + query.limit
+        for entry in self._newest_first(lo, hi):
+            if query.incident_id and entry.incident_id != query.incident_id:
+                continue
+            if query.action and entry.action != query.action:
+                continue
+            
+            if matched >= query.offset:
+                results.append(entry)
+            matched += 1
+            if matched >= end_idx:
+                break
         
-        return results[start_idx:end_idx]
+        return results
     
     async def get_incident_audit_trail(self, incident_id: str) -> List[AuditLogEntry]:
         """Get complete audit trail for a specific incident."""
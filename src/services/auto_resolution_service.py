@@ -15,6 +15,44 @@ from src.services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
 
+# Statuses that mean the incident no longer needs resolving
+_TERMINAL_STATUSES = frozenset({
+    IncidentStatus.AUTO_RESOLVED,
+    IncidentStatus.MANUALLY_RESOLVED,
+    IncidentStatus.CLOSED
+})
+
+# Resolution steps per category value.
+# This would typically come from a configuration database or service.
+_RESOLUTION_STEPS_BY_CATEGORY = {
+    "network": [
+        {"description": "Check network connectivity", "action": "ping_check"},
+        {"description": "Restart network service", "action": "service_restart"},
+        {"description": "Verify resolution", "action": "health_check"}
+    ],
+    "database": [
+        {"description": "Check database connections", "action": "connection_check"},
+        {"description": "Clear connection pool", "action": "pool_clear"},
+        {"description": "Verify database health", "action": "health_check"}
+    ],
+    "application": [
+        {"description": "Check application logs", "action": "log_check"},
+        {"description": "Restart application service", "action": "service_restart"},
+        {"description": "Verify application health", "action": "health_check"}
+    ],
+    "ios_upgrade": [
+        {"description": "Check iOS version compatibility", "action": "ios_version_check"},
+        {"description": "Verify app bundle and provisioning profiles", "action": "bundle_verification"},
+        {"description": "Clear derived data and build cache", "action": "cache_clear"},
+        {"description": "Validate API compatibility with iOS version", "action": "api_compatibility_check"},
+        {"description": "Run automated iOS build test", "action": "build_test"}
+    ]
+}
+
+_DEFAULT_RESOLUTION_STEPS = [
+    {"description": "Generic health check", "action": "health_check"}
+]
+
 
 class AutoResolutionService:
     """
@@ -50,7 +88,7 @@ class AutoResolutionService:
             return False, "Auto-resolution is globally disabled (kill switch active)"
         
         # Check if already resolved
-        if incident.status in [IncidentStatus.AUTO_RESOLVED, IncidentStatus.MANUALLY_RESOLVED, IncidentStatus.CLOSED]:
+        if incident.status in _TERMINAL_STATUSES:
             return False, f"Incident already in status: {incident.status}"
         
         # Check category-specific settings
@@ -64,17 +102,23 @@ class AutoResolutionService:
         
         return True, "All checks passed"
     
-    async def resolve_incident(self, incident: Incident) -> IncidentResolutionResponse:
+    async def resolve_incident(
+        self,
+        incident: Incident,
+        notify: bool = True
+    ) -> IncidentResolutionResponse:
         """
         Attempt to auto-resolve an incident.
         
         Args:
             incident: The incident to resolve
+            notify: Notify the incident creator on success. Bulk callers pass
+                False and send one batched notification afterwards.
             
         Returns:
             IncidentResolutionResponse with resolution details
         """
-        logger.info(f"Starting auto-resolution for incident {incident.incident_id}")
+        logger.info("Starting auto-resolution for incident %s", incident.incident_id)
         
         # Audit: Resolution attempted
         await self.audit_service.log_auto_resolution_attempt(
@@ -86,7 +130,7 @@ class AutoResolutionService:
         can_resolve, reason = await self.can_auto_resolve(incident)
         
         if not can_resolve:
-            logger.warning(f"Cannot auto-resolve incident {incident.incident_id}: {reason}")
+            logger.warning("Cannot auto-resolve incident %s: %s", incident.incident_id, reason)
             await self.audit_service.log_auto_resolution_skipped(
                 incident_id=incident.incident_id,
                 reason=reason,
@@ -104,11 +148,12 @@ class AutoResolutionService:
             resolution_steps = await self._execute_resolution_steps(incident)
             
             # Update incident status
+            resolved_at = datetime.utcnow()
             incident.status = IncidentStatus.AUTO_RESOLVED
             incident.auto_resolved = True
-            incident.resolved_at = datetime.utcnow()
+            incident.resolved_at = resolved_at
             incident.resolution_steps = resolution_steps
-            incident.updated_at = datetime.utcnow()
+            incident.updated_at = resolved_at
             
             # Audit: Resolution success
             await self.audit_service.log_auto_resolution_success(
@@ -118,12 +163,13 @@ class AutoResolutionService:
             )
             
             # Send notification to incident creator
-            await self.notification_service.notify_auto_resolution(
-                incident=incident,
-                resolution_steps=resolution_steps
-            )
+            if notify:
+                await self.notification_service.notify_auto_resolution(
+                    incident=incident,
+                    resolution_steps=resolution_steps
+                )
             
-            logger.info(f"Successfully auto-resolved incident {incident.incident_id}")
+            logger.info("Successfully auto-resolved incident %s", incident.incident_id)
             
             return IncidentResolutionResponse(
                 incident_id=incident.incident_id,
@@ -135,7 +181,7 @@ class AutoResolutionService:
             
         except Exception as e:
             error_message = f"Failed to auto-resolve incident: {str(e)}"
-            logger.error(f"Error resolving incident {incident.incident_id}: {error_message}", exc_info=True)
+            logger.exception("Error resolving incident %s: %s", incident.incident_id, error_message)
             
             # Audit: Resolution failed
             await self.audit_service.log_auto_resolution_failed(
@@ -179,13 +225,13 @@ class AutoResolutionService:
                 await self._execute_step(step, incident)
                 step.executed_at = datetime.utcnow()
                 step.success = True
-                logger.info(f"Executed step {step.step_id}: {step.description}")
+                logger.info("Executed step %s: %s", step.step_id, step.description)
                 
             except Exception as e:
                 step.executed_at = datetime.utcnow()
                 step.success = False
                 step.error_message = str(e)
-                logger.error(f"Failed to execute step {step.step_id}: {str(e)}")
+                logger.error("Failed to execute step %s: %s", step.step_id, e)
                 # In production, you might want to rollback previous steps
                 
             resolution_steps.append(step)
@@ -194,35 +240,7 @@ class AutoResolutionService:
     
     def _get_resolution_steps_for_category(self, category) -> List[dict]:
         """Get resolution steps configuration for a given incident category."""
-        # This would typically come from a configuration database or service
-        steps_map = {
-            "network": [
-                {"description": "Check network connectivity", "action": "ping_check"},
-                {"description": "Restart network service", "action": "service_restart"},
-                {"description": "Verify resolution", "action": "health_check"}
-            ],
-            "database": [
-                {"description": "Check database connections", "action": "connection_check"},
-                {"description": "Clear connection pool", "action": "pool_clear"},
-                {"description": "Verify database health", "action": "health_check"}
-            ],
-            "application": [
-                {"description": "Check application logs", "action": "log_check"},
-                {"description": "Restart application service", "action": "service_restart"},
-                {"description": "Verify application health", "action": "health_check"}
-            ],
-            "ios_upgrade": [
-                {"description": "Check iOS version compatibility", "action": "ios_version_check"},
-                {"description": "Verify app bundle and provisioning profiles", "action": "bundle_verification"},
-                {"description": "Clear derived data and build cache", "action": "cache_clear"},
-                {"description": "Validate API compatibility with iOS version", "action": "api_compatibility_check"},
-                {"description": "Run automated iOS build test", "action": "build_test"}
-            ]
-        }
-        
-        return steps_map.get(category.value, [
-            {"description": "Generic health check", "action": "health_check"}
-        ])
+        return _RESOLUTION_STEPS_BY_CATEGORY.get(category.value, _DEFAULT_RESOLUTION_STEPS)
     
     async def _execute_step(self, step: ResolutionStep, incident: Incident):
         """
@@ -236,6 +254,6 @@ class AutoResolutionService:
         - Custom remediation scripts
         """
         # Placeholder implementation
-        logger.info(f"Executing action '{step.action}' for incident {incident.incident_id}")
+        logger.info("Executing action '%s' for incident %s", step.action, incident.incident_id)
         # In production: call actual remediation APIs/scripts here
         pass
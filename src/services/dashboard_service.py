@@ -5,6 +5,8 @@ class DashboardService:
     Service to manage user dashboard widgets including add, remove, and rearrange.
     """
 
+    __slots__ = ("dashboards", "responsive_layout_enabled")
+
     def __init__(self):
         # Initial dashboard layout
         self.dashboards: Dict[str, List[Dict]] = {}
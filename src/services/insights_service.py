@@ -1,9 +1,12 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from itertools import chain
+from typing import Deque, List, Optional, Dict, Any, Sequence, Tuple
 from uuid import uuid4
 import time
 import random
+from collections import deque
 
 from src.models.insight import (
     TrendAnalysis, AnomalyDetection, Prediction, MetricSummary,
@@ -13,12 +16,41 @@ from src.models.insight import (
 
 logger = logging.getLogger(__name__)
 
+_METRICS_MAP: Dict[ServiceArea, Tuple[str, ...]] = {
+    ServiceArea.NETWORK: ("response_time_ms", "packet_loss_rate", "bandwidth_utilization"),
+    ServiceArea.DATABASE: ("query_time_ms", "connection_count", "cache_hit_rate"),
+    ServiceArea.APPLICATION: ("error_rate", "request_count", "cpu_usage"),
+    ServiceArea.SECURITY: ("failed_auth_attempts", "vulnerability_count", "threat_level"),
+    ServiceArea.INFRASTRUCTURE: ("disk_usage", "memory_usage", "uptime_percentage"),
+    ServiceArea.USER_ACCESS: ("active_users", "session_duration", "access_denied_count")
+}
+
+_ALL_SERVICE_AREAS: Tuple[ServiceArea, ...] = tuple(ServiceArea)
+_DEFAULT_SUMMARY_AREA = ServiceArea.APPLICATION
+
+_ONE_DAY = timedelta(days=1)
+
+# Retention cap for in-memory insight feedback; oldest entries are dropped first
+_FEEDBACK_RETENTION = 10_000
+
+# Display forms for summaries, e.g. "user_access" -> "User Access"
+_AREA_TITLES: Dict[ServiceArea, str] = {
+    area: area.value.replace('_', ' ').title() for area in ServiceArea
+}
+_METRIC_LABELS: Dict[str, str] = {
+    metric: metric.replace('_', ' ') for metric in chain.from_iterable(_METRICS_MAP.values())
+}
+
+
+async def _no_results() -> list:
+    return []
+
 
 class InsightsService:
     
     def __init__(self):
-        self._feedback_store: List[InsightFeedback] = []
-        self._threshold_configs: Dict[str, AnomalyThresholdConfig] = {}
+        self._feedback_store: Deque[InsightFeedback] = deque(maxlen=_FEEDBACK_RETENTION)
+        self._threshold_configs: Dict[Tuple[ServiceArea, str], AnomalyThresholdConfig] = {}
         self._initialize_default_thresholds()
     
     def _initialize_default_thresholds(self):
@@ -43,33 +75,29 @@ class InsightsService:
             )
         ]
         for config in default_thresholds:
-            key = f"{config.service_area.value}:{config.metric_name}"
-            self._threshold_configs[key] = config
+            self._threshold_configs[(config.service_area, config.metric_name)] = config
     
     async def generate_insights(self, request: InsightsRequest) -> InsightsResponse:
         start_time = time.time()
-        logger.info(f"Generating insights for {request.time_period_days} days")
-        
-        service_areas = request.service_areas or list(ServiceArea)
-        
-        trends = []
-        anomalies = []
-        predictions = []
-        
-        if request.include_trends:
-            trends = await self._analyze_trends(service_areas, request.time_period_days)
+        logger.info("Generating insights for %s days", request.time_period_days)
         
-        if request.include_anomalies:
-            anomalies = await self._detect_anomalies(service_areas)
+        service_areas = request.service_areas or _ALL_SERVICE_AREAS
         
-        if request.include_predictions:
-            predictions = await self._generate_predictions(service_areas)
+        # Trends, anomalies and predictions are independent, so run them concurrently
+        trends, anomalies, predictions = await asyncio.gather(
+            self._analyze_trends(service_areas, request.time_period_days)
+            if request.include_trends else _no_results(),
+            self._detect_anomalies(service_areas)
+            if request.include_anomalies else _no_results(),
+            self._generate_predictions(service_areas)
+            if request.include_predictions else _no_results()
+        )
         
         summary = await self._generate_summary(service_areas, request.time_period_days, trends, anomalies)
         
         processing_time_ms = int((time.time() - start_time) * 1000)
         
-        logger.info(f"Generated insights in {processing_time_ms}ms")
+        logger.info("Generated insights in %sms", processing_time_ms)
         
         return InsightsResponse(
             trends=trends,
@@ -81,132 +109,154 @@ class InsightsService:
     
     async def _analyze_trends(
         self,
-        service_areas: List[ServiceArea],
+        service_areas: Sequence[ServiceArea],
         time_period_days: int
+    ) -> List[TrendAnalysis]:
+        # Every series in a request covers the same days, so share the date labels
+        dates = self._build_date_labels(time_period_days)
+        results = await asyncio.gather(
+            *(self._analyze_area_trends(area, time_period_days, dates) for area in service_areas)
+        )
+        return list(chain.from_iterable(results))
+    
+    async def _analyze_area_trends(
+        self,
+        area: ServiceArea,
+        time_period_days: int,
+        dates: List[str]
     ) -> List[TrendAnalysis]:
         trends = []
         
-        for area in service_areas:
-            metrics = self._get_metrics_for_area(area)
+        for metric_name in self._get_metrics_for_area(area):
+            values = self._generate_mock_values(time_period_days)
+            direction, change_pct = self._calculate_trend(values)
+            data_points = [{"date": d, "value": v} for d, v in zip(dates, values)]
             
-            for metric_name in metrics:
-                data_points = self._generate_mock_time_series(time_period_days)
-                direction, change_pct = self._calculate_trend(data_points)
-                
-                trend = TrendAnalysis(
-                    analysis_id=str(uuid4()),
-                    service_area=area,
-                    metric_name=metric_name,
-                    direction=direction,
-                    change_percentage=change_pct,
-                    confidence_score=self._calculate_confidence(data_points),
-                    time_period_days=time_period_days,
-                    data_points=data_points,
-                    summary=self._generate_trend_summary(area, metric_name, direction, change_pct)
-                )
-                trends.append(trend)
+            trend = TrendAnalysis.model_construct(
+                analysis_id=uuid4().hex,
+                service_area=area,
+                metric_name=metric_name,
+                direction=direction,
+                change_percentage=change_pct,
+                confidence_score=self._calculate_confidence(data_points),
+                time_period_days=time_period_days,
+                data_points=data_points,
+                summary=self._generate_trend_summary(area, metric_name, direction, change_pct)
+            )
+            trends.append(trend)
         
         return trends
     
-    async def _detect_anomalies(self, service_areas: List[ServiceArea]) -> List[AnomalyDetection]:
-        anomalies = []
+    async def _detect_anomalies(self, service_areas: Sequence[ServiceArea]) -> List[AnomalyDetection]:
+        results = await asyncio.gather(
+            *(self._detect_area_anomalies(area) for area in service_areas)
+        )
+        return list(chain.from_iterable(results))
+    
+    async def _detect_area_anomalies(self, area: ServiceArea) -> List[AnomalyDetection]:
+        configs = []
+        for metric_name in self._get_metrics_for_area(area):
+            config = self._threshold_configs.get((area, metric_name))
+            if config and config.enabled:
+                configs.append(config)
+        
+        # Sample every monitored metric first, then only build models for breaches
+        readings = [
+            (config, self._get_current_metric_value(area, config.metric_name))
+            for config in configs
+        ]
         
-        for area in service_areas:
-            metrics = self._get_metrics_for_area(area)
+        anomalies = []
+        for config, actual_value in readings:
+            if actual_value <= config.threshold_value * 1.2:
+                continue
+            
+            metric_name = config.metric_name
+            anomaly_type = AnomalyType.SPIKE
+            deviation = ((actual_value - config.threshold_value) / config.threshold_value) * 100
+            severity = min(deviation / 100, 1.0)
             
-            for metric_name in metrics:
-                key = f"{area.value}:{metric_name}"
-                config = self._threshold_configs.get(key)
-                
-                if not config or not config.enabled:
-                    continue
-                
-                actual_value = self._get_current_metric_value(area, metric_name)
-                
-                if actual_value > config.threshold_value * 1.2:
-                    anomaly_type = AnomalyType.SPIKE
-                    deviation = ((actual_value - config.threshold_value) / config.threshold_value) * 100
-                    severity = min(deviation / 100, 1.0)
-                    
-                    anomaly = AnomalyDetection(
-                        anomaly_id=str(uuid4()),
-                        service_area=area,
-                        metric_name=metric_name,
-                        anomaly_type=anomaly_type,
-                        severity=severity,
-                        threshold_value=config.threshold_value,
-                        actual_value=actual_value,
-                        deviation_percentage=deviation,
-                        explanation=self._generate_anomaly_explanation(area, metric_name, anomaly_type, deviation),
-                        recommended_actions=self._get_anomaly_actions(area, metric_name, anomaly_type)
-                    )
-                    anomalies.append(anomaly)
+            anomaly = AnomalyDetection(
+                anomaly_id=uuid4().hex,
+                service_area=area,
+                metric_name=metric_name,
+                anomaly_type=anomaly_type,
+                severity=severity,
+                threshold_value=config.threshold_value,
+                actual_value=actual_value,
+                deviation_percentage=deviation,
+                explanation=self._generate_anomaly_explanation(area, metric_name, anomaly_type, deviation),
+                recommended_actions=self._get_anomaly_actions(area, metric_name, anomaly_type)
+            )
+            anomalies.append(anomaly)
         
         return anomalies
     
-    async def _generate_predictions(self, service_areas: List[ServiceArea]) -> List[Prediction]:
+    async def _generate_predictions(self, service_areas: Sequence[ServiceArea]) -> List[Prediction]:
+        results = await asyncio.gather(
+            *(self._generate_area_predictions(area) for area in service_areas)
+        )
+        return list(chain.from_iterable(results))
+    
+    async def _generate_area_predictions(self, area: ServiceArea) -> List[Prediction]:
         predictions = []
         
-        for area in service_areas:
-            metrics = self._get_metrics_for_area(area)
+        for metric_name in self._get_metrics_for_area(area)[:2]:
+            historical_values = self._generate_mock_values(30)
+            predicted_value = self._forecast_value(historical_values)
+            confidence_interval = predicted_value * 0.15
             
-            for metric_name in metrics[:2]:
-                historical_data = self._generate_mock_time_series(30)
-                predicted_value = self._forecast_value(historical_data)
-                confidence_interval = predicted_value * 0.15
-                
-                prediction = Prediction(
-                    prediction_id=str(uuid4()),
-                    service_area=area,
-                    metric_name=metric_name,
-                    predicted_value=predicted_value,
-                    confidence_interval_low=predicted_value - confidence_interval,
-                    confidence_interval_high=predicted_value + confidence_interval,
-                    confidence_score=0.75 + random.random() * 0.2,
-                    forecast_horizon_days=7,
-                    summary=self._generate_prediction_summary(area, metric_name, predicted_value),
-                    factors=self._identify_prediction_factors(area, metric_name)
-                )
-                predictions.append(prediction)
+            prediction = Prediction.model_construct(
+                prediction_id=uuid4().hex,
+                service_area=area,
+                metric_name=metric_name,
+                predicted_value=predicted_value,
+                confidence_interval_low=predicted_value - confidence_interval,
+                confidence_interval_high=predicted_value + confidence_interval,
+                confidence_score=0.75 + random.random() * 0.2,
+                forecast_horizon_days=7,
+                summary=self._generate_prediction_summary(area, metric_name, predicted_value),
+                factors=self._identify_prediction_factors(area, metric_name)
+            )
+            predictions.append(prediction)
         
         return predictions
     
     async def _generate_summary(
         self,
-        service_areas: List[ServiceArea],
+        service_areas: Sequence[ServiceArea],
         time_period_days: int,
         trends: List[TrendAnalysis],
         anomalies: List[AnomalyDetection]
     ) -> MetricSummary:
         
-        key_metrics = {}
-        for area in service_areas:
-            key_metrics[area.value] = {
-                "incident_count": random.randint(10, 50),
-                "avg_resolution_time": random.randint(15, 120),
-                "success_rate": round(0.85 + random.random() * 0.1, 2)
+        randint = random.randint
+        rand = random.random
+        key_metrics = {
+            area.value: {
+                "incident_count": randint(10, 50),
+                "avg_resolution_time": randint(15, 120),
+                "success_rate": round(0.85 + rand() * 0.1, 2)
             }
+            for area in service_areas
+        }
         
         insights = []
-        if trends:
-            increasing_trends = [t for t in trends if t.direction == TrendDirection.INCREASING]
-            if increasing_trends:
-                insights.append(f"{len(increasing_trends)} metrics showing upward trends")
+        increasing_count = sum(1 for t in trends if t.direction is TrendDirection.INCREASING)
+        if increasing_count:
+            insights.append(f"{increasing_count} metrics showing upward trends")
         
-        if anomalies:
-            critical_anomalies = [a for a in anomalies if a.severity > 0.7]
-            if critical_anomalies:
-                insights.append(f"{len(critical_anomalies)} critical anomalies detected")
+        critical_count = sum(1 for a in anomalies if a.severity > 0.7)
+        if critical_count:
+            insights.append(f"{critical_count} critical anomalies detected")
         
-        action_items = []
-        for anomaly in anomalies[:3]:
-            action_items.extend(anomaly.recommended_actions)
+        action_items = list(chain.from_iterable(a.recommended_actions for a in anomalies[:3]))
         
         summary_text = self._generate_executive_summary(key_metrics, insights, action_items)
         
         return MetricSummary(
-            summary_id=str(uuid4()),
-            service_area=service_areas[0] if service_areas else ServiceArea.APPLICATION,
+            summary_id=uuid4().hex,
+            service_area=service_areas[0] if service_areas else _DEFAULT_SUMMARY_AREA,
             time_period_days=time_period_days,
             key_metrics=key_metrics,
             insights=insights,
@@ -215,15 +265,17 @@ class InsightsService:
         )
     
     async def submit_feedback(self, feedback: InsightFeedback) -> InsightFeedback:
-        logger.info(f"Received feedback for insight {feedback.insight_id}")
+        logger.info("Received feedback for insight %s", feedback.insight_id)
         self._feedback_store.append(feedback)
         await self._update_ai_model(feedback)
         return feedback
     
     async def configure_threshold(self, config: AnomalyThresholdConfig) -> AnomalyThresholdConfig:
-        key = f"{config.service_area.value}:{config.metric_name}"
-        self._threshold_configs[key] = config
-        logger.info(f"Updated threshold for {key}: {config.threshold_value}")
+        self._threshold_configs[(config.service_area, config.metric_name)] = config
+        logger.info(
+            "Updated threshold for %s:%s: %s",
+            config.service_area.value, config.metric_name, config.threshold_value
+        )
         return config
     
     async def get_thresholds(self, service_area: Optional[ServiceArea] = None) -> List[AnomalyThresholdConfig]:
@@ -232,40 +284,32 @@ class InsightsService:
         return list(self._threshold_configs.values())
     
     async def _update_ai_model(self, feedback: InsightFeedback):
-        logger.info(f"Updating AI model with feedback: {feedback.feedback_type.value}")
+        logger.info("Updating AI model with feedback: %s", feedback.feedback_type.value)
     
-    def _get_metrics_for_area(self, area: ServiceArea) -> List[str]:
-        metrics_map = {
-            ServiceArea.NETWORK: ["response_time_ms", "packet_loss_rate", "bandwidth_utilization"],
-            ServiceArea.DATABASE: ["query_time_ms", "connection_count", "cache_hit_rate"],
-            ServiceArea.APPLICATION: ["error_rate", "request_count", "cpu_usage"],
-            ServiceArea.SECURITY: ["failed_auth_attempts", "vulnerability_count", "threat_level"],
-            ServiceArea.INFRASTRUCTURE: ["disk_usage", "memory_usage", "uptime_percentage"],
-            ServiceArea.USER_ACCESS: ["active_users", "session_duration", "access_denied_count"]
-        }
-        return metrics_map.get(area, [])
+    def _get_metrics_for_area(self, area: ServiceArea) -> Tuple[str, ...]:
+        return _METRICS_MAP.get(area, ())
     
-    def _generate_mock_time_series(self, days: int) -> List[Dict[str, Any]]:
+    def _generate_mock_values(self, days: int) -> List[float]:
         base_value = random.uniform(50, 100)
         trend = random.uniform(-2, 2)
+        uniform = random.uniform
         
-        data_points = []
-        for i in range(days):
-            date = datetime.utcnow() - timedelta(days=days - i)
-            value = base_value + (trend * i) + random.uniform(-10, 10)
-            data_points.append({
-                "date": date.isoformat(),
-                "value": max(0, round(value, 2))
-            })
-        
-        return data_points
+        return [max(0, round(base_value + trend * i + uniform(-10, 10), 2)) for i in range(days)]
+    
+    def _build_date_labels(self, days: int) -> List[str]:
+        current = datetime.utcnow() - timedelta(days=days)
+        labels = []
+        for _ in range(days):
+            labels.append(current.isoformat())
+            current += _ONE_DAY
+        return labels
     
-    def _calculate_trend(self, data_points: List[Dict[str, Any]]) -> tuple[TrendDirection, float]:
-        if len(data_points) < 2:
+    def _calculate_trend(self, values: List[float]) -> tuple[TrendDirection, float]:
+        if len(values) < 2:
             return TrendDirection.STABLE, 0.0
         
-        first_value = data_points[0]["value"]
-        last_value = data_points[-1]["value"]
+        first_value = values[0]
+        last_value = values[-1]
         
         change_pct = ((last_value - first_value) / first_value) * 100 if first_value > 0 else 0
         
@@ -282,10 +326,10 @@ class InsightsService:
     def _get_current_metric_value(self, area: ServiceArea, metric_name: str) -> float:
         return random.uniform(100, 1500)
     
-    def _forecast_value(self, historical_data: List[Dict[str, Any]]) -> float:
-        if not historical_data:
+    def _forecast_value(self, historical_values: List[float]) -> float:
+        if not historical_values:
             return 0.0
-        recent_values = [d["value"] for d in historical_data[-7:]]
+        recent_values = historical_values[-7:]
         return sum(recent_values) / len(recent_values) * (1 + random.uniform(-0.1, 0.2))
     
     def _generate_trend_summary(
@@ -295,7 +339,9 @@ class InsightsService:
         direction: TrendDirection,
         change_pct: float
     ) -> str:
-        return f"{area.value.replace('_', ' ').title()} {metric.replace('_', ' ')} is {direction.value} by {abs(change_pct):.1f}% over the period."
+        area_title = _AREA_TITLES[area]
+        metric_label = _METRIC_LABELS.get(metric) or metric.replace('_', ' ')
+        return f"{area_title} {metric_label} is {direction.value} by {abs(change_pct):.1f}% over the period."
     
     def _generate_anomaly_explanation(
         self,
@@ -341,10 +387,9 @@ class InsightsService:
         insights: List[str],
         action_items: List[str]
     ) -> str:
-        summary_parts = [
-            "Executive Summary:",
-            f"Analyzed {len(key_metrics)} service areas.",
-            " ".join(insights) if insights else "Overall system performance is stable.",
-            f"Recommended {len(action_items)} priority actions." if action_items else "No critical actions required."
-        ]
-        return " ".join(summary_parts)
+        insight_text = " ".join(insights) if insights else "Overall system performance is stable."
+        action_text = (
+            f"Recommended {len(action_items)} priority actions."
+            if action_items else "No critical actions required."
+        )
+        return f"Executive Summary: Analyzed {len(key_metrics)} service areas. {insight_text} {action_text}"
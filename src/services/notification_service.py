@@ -2,7 +2,7 @@
 Notification service - notifies incident creators of auto-resolutions.
 """
 import logging
-from typing import List
+from typing import List, Tuple
 from datetime import datetime
 
 from src.models.incident import Incident, ResolutionStep
@@ -10,6 +10,64 @@ from src.services.audit_service import AuditService
 
 logger = logging.getLogger(__name__)
 
+_AUTO_RESOLUTION_HEADER = """
+Incident Auto-Resolution Notification
+=====================================
+
+Your incident has been automatically resolved by the system.
+
+Incident Details:
+- ID: {incident_id}
+- Title: {title}
+- Category: {category}
+- Priority: {priority}
+- Confidence Score: {confidence_score:.2%}
+- Resolved At: {resolved_at}
+
+Resolution Summary:
+- Total Steps: {total_steps}
+- Successful: {successful}
+- Failed: {failed}
+
+Resolution Steps Taken:
+"""
+
+_AUTO_RESOLUTION_FOOTER = """
+If you believe this resolution is incorrect or incomplete, please:
+1. Review the incident in the incident management system
+2. Re-open the incident if necessary
+3. Contact the operations team for manual intervention
+
+This is an automated message. For questions, please contact your IT Operations team.
+"""
+
+_KILL_SWITCH_ALERT = """
+ALERT: Auto-Resolution Kill Switch Activated
+============================================
+
+The emergency kill switch for auto-resolution has been activated.
+
+- Activated By: {activated_by}
+- Time: {time}
+- Reason: {reason}
+
+All automatic incident resolutions are now disabled.
+Manual incident resolution is still available.
+
+To re-enable auto-resolution, deactivate the kill switch through the configuration API.
+"""
+
+
+def _partition_steps(
+    steps: List[ResolutionStep]
+) -> Tuple[List[ResolutionStep], List[ResolutionStep]]:
+    """Split resolution steps into (successful, failed) in one pass."""
+    successful: List[ResolutionStep] = []
+    failed: List[ResolutionStep] = []
+    for step in steps:
+        (successful if step.success else failed).append(step)
+    return successful, failed
+
 
 class NotificationService:
     """
@@ -66,67 +124,97 @@ class NotificationService:
             )
             
             logger.info(
-                f"Auto-resolution notification sent for incident {incident.incident_id} "
-                f"to user {incident.created_by}"
+                "Auto-resolution notification sent for incident %s to user %s",
+                incident.incident_id, incident.created_by
             )
             
             return True
             
-        except Exception as e:
-            logger.error(
-                f"Failed to send notification for incident {incident.incident_id}: {str(e)}",
-                exc_info=True
+        except Exception:
+            logger.exception(
+                "Failed to send notification for incident %s", incident.incident_id
             )
             return False
     
+    async def notify_auto_resolution_batch(
+        self,
+        resolutions: List[Tuple[Incident, List[ResolutionStep]]]
+    ) -> List[bool]:
+        """
+        Notify incident creators about a batch of auto-resolutions.
+        
+        Messages are rendered per incident but dispatched in a single bulk
+        send, and the audit trail is written in one call. A single item goes
+        through notify_auto_resolution directly.
+        
+        Args:
+            resolutions: (incident, resolution_steps) pairs
+            
+        Returns:
+            List[bool]: Per-incident send status, in input order
+        """
+        if not resolutions:
+            return []
+        if len(resolutions) == 1:
+            # A batch of one gains nothing from the bulk path
+            incident, resolution_steps = resolutions[0]
+            return [await self.notify_auto_resolution(incident, resolution_steps)]
+        
+        try:
+            outgoing = [
+                (
+                    incident.created_by,
+                    f"Incident {incident.incident_id} Auto-Resolved",
+                    self._build_notification_message(incident, resolution_steps)
+                )
+                for incident, resolution_steps in resolutions
+            ]
+            
+            await self._send_notifications_bulk(outgoing)
+            
+            await self.audit_service.log_notifications_sent_bulk([
+                (incident.incident_id, incident.created_by, "auto_resolution")
+                for incident, _ in resolutions
+            ])
+            
+            logger.info("Auto-resolution notifications sent for %d incidents", len(resolutions))
+            
+            return [True] * len(resolutions)
+            
+        except Exception:
+            logger.exception(
+                "Failed to send batched notifications for %d incidents", len(resolutions)
+            )
+            return [False] * len(resolutions)
+    
     def _build_notification_message(
         self,
         incident: Incident,
         resolution_steps: List[ResolutionStep]
     ) -> str:
         """Build a detailed notification message."""
-        successful_steps = [s for s in resolution_steps if s.success]
-        failed_steps = [s for s in resolution_steps if not s.success]
+        successful_steps, failed_steps = _partition_steps(resolution_steps)
         
-        message = f"""
-Incident Auto-Resolution Notification
-=====================================
-
-Your incident has been automatically resolved by the system.
-
-Incident Details:
-- ID: {incident.incident_id}
-- Title: {incident.title}
-- Category: {incident.category.value}
-- Priority: {incident.priority.value}
-- Confidence Score: {incident.confidence_score:.2%}
-- Resolved At: {incident.resolved_at.isoformat() if incident.resolved_at else 'N/A'}
-
-Resolution Summary:
-- Total Steps: {len(resolution_steps)}
-- Successful: {len(successful_steps)}
-- Failed: {len(failed_steps)}
-
-Resolution Steps Taken:
-"""
+        parts = [_AUTO_RESOLUTION_HEADER.format(
+            incident_id=incident.incident_id,
+            title=incident.title,
+            category=incident.category.value,
+            priority=incident.priority.value,
+            confidence_score=incident.confidence_score,
+            resolved_at=incident.resolved_at.isoformat() if incident.resolved_at else 'N/A',
+            total_steps=len(resolution_steps),
+            successful=len(successful_steps),
+            failed=len(failed_steps)
+        )]
         
         for i, step in enumerate(resolution_steps, 1):
             status = "✓ SUCCESS" if step.success else "✗ FAILED"
-            message += f"\n{i}. [{status}] {step.description}"
+            parts.append(f"{i}. [{status}] {step.description}")
             if step.error_message:
-                message += f"\n   Error: {step.error_message}"
+                parts.append(f"   Error: {step.error_message}")
         
-        message += """
-
-If you believe this resolution is incorrect or incomplete, please:
-1. Review the incident in the incident management system
-2. Re-open the incident if necessary
-3. Contact the operations team for manual intervention
-
-This is an automated message. For questions, please contact your IT Operations team.
-"""
-        
-        return message
+        parts.append(_AUTO_RESOLUTION_FOOTER)
+        return "\n".join(parts)
     
     async def _send_notification(
         self,
@@ -141,7 +229,7 @@ This is an automated message. For questions, please contact your IT Operations t
         This is a placeholder for actual notification implementation.
         In production, implement integration with your notification systems.
         """
-        logger.info(f"Sending notification to {recipient}: {subject}")
+        logger.info("Sending notification to %s: %s", recipient, subject)
         
         # Placeholder implementations:
         
@@ -168,28 +256,42 @@ This is an automated message. For questions, please contact your IT Operations t
         # )
         
         # For now, just log it
-        logger.debug(f"Notification content:\n{message}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Notification content:\n%s", message)
+    
+    async def _send_notifications_bulk(
+        self,
+        notifications: List[Tuple[str, str, str]]
+    ):
+        """
+        Send several notifications through one call per channel.
+        
+        Placeholder like _send_notification; in production this maps to the
+        providers' bulk APIs (e.g. one SendGrid request with multiple
+        personalizations, one Slack/Teams batch publish).
+        
+        Args:
+            notifications: (recipient, subject, message) tuples
+        """
+        logger.info(
+            "Sending %d notifications to %d recipients",
+            len(notifications), len({recipient for recipient, _, _ in notifications})
+        )
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for recipient, subject, message in notifications:
+                logger.debug("Notification to %s: %s\n%s", recipient, subject, message)
     
     async def notify_kill_switch_activated(self, activated_by: str, reason: str):
         """Notify operations team that kill switch was activated."""
-        logger.warning(f"Kill switch activated by {activated_by}: {reason}")
+        logger.warning("Kill switch activated by %s: %s", activated_by, reason)
         
         # In production, send urgent notifications to operations team
-        message = f"""
-ALERT: Auto-Resolution Kill Switch Activated
-============================================
-
-The emergency kill switch for auto-resolution has been activated.
-
-- Activated By: {activated_by}
-- Time: {datetime.utcnow().isoformat()}
-- Reason: {reason}
-
-All automatic incident resolutions are now disabled.
-Manual incident resolution is still available.
-
-To re-enable auto-resolution, deactivate the kill switch through the configuration API.
-"""
+        message = _KILL_SWITCH_ALERT.format(
+            activated_by=activated_by,
+            time=datetime.utcnow().isoformat(),
+            reason=reason
+        )
         
         # Send to operations team (placeholder)
         logger.critical(message)
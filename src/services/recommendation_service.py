@@ -1,9 +1,10 @@
 """
 Resolution recommendation service - generates resolution suggestions based on historical data.
 """
+import heapq
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import uuid4
 import time
 
@@ -13,12 +14,21 @@ from src.models.recommendation import (
     RecommendationResponse,
     RecommendationFeedback,
     FeedbackRequest,
+    FeedbackRating,
     RecommendationStatus
 )
 from src.services.audit_service import AuditService
 
 logger = logging.getLogger(__name__)
 
+# Numeric score for each feedback rating, used for average ratings
+_RATING_SCORES = {
+    FeedbackRating.VERY_HELPFUL: 4,
+    FeedbackRating.HELPFUL: 3,
+    FeedbackRating.SOMEWHAT_HELPFUL: 2,
+    FeedbackRating.NOT_HELPFUL: 1
+}
+
 
 class RecommendationService:
     """
@@ -39,6 +49,9 @@ class RecommendationService:
         # - ML model service for similarity matching
         # - Recommendation training pipeline
         self._feedback_store: List[RecommendationFeedback] = []
+        self._feedback_by_recommendation: Dict[str, List[RecommendationFeedback]] = {}
+        self._feedback_by_incident: Dict[str, List[RecommendationFeedback]] = {}
+        self._historical_recommendations = self._seed_historical_recommendations()
         
     async def get_recommendations(
         self,
@@ -67,16 +80,14 @@ class RecommendationService:
                 category=incident.category.value
             )
             
-            # Fetch recommendations from historical data
+            # Fetch recommendations from historical data, already ranked
+            # by success rate
             recommendations = await self._fetch_recommendations(
                 incident=incident,
                 max_recommendations=max_recommendations,
                 min_success_rate=min_success_rate
             )
             
-            # Rank by success rate (already done in fetch, but explicit for clarity)
-            recommendations.sort(key=lambda r: r.success_rate, reverse=True)
-            
             processing_time_ms = int((time.time() - start_time) * 1000)
             
             # Ensure we meet the 10-second requirement
@@ -153,6 +164,8 @@ class RecommendationService:
         
         # Store feedback (in production, this would be persisted to a database)
         self._feedback_store.append(feedback)
+        self._feedback_by_recommendation.setdefault(feedback.recommendation_id, []).append(feedback)
+        self._feedback_by_incident.setdefault(feedback.incident_id, []).append(feedback)
         
         # Audit: Feedback submitted
         await self.audit_service.log_recommendation_feedback(
@@ -176,7 +189,7 @@ class RecommendationService:
     
     async def get_feedback_for_incident(self, incident_id: str) -> List[RecommendationFeedback]:
         """Get all feedback for recommendations of a specific incident."""
-        return [f for f in self._feedback_store if f.incident_id == incident_id]
+        return list(self._feedback_by_incident.get(incident_id, ()))
     
     async def get_feedback_stats(self, recommendation_id: str) -> dict:
         """
@@ -185,10 +198,7 @@ class RecommendationService:
         Returns:
             Dictionary with feedback metrics
         """
-        feedback_list = [
-            f for f in self._feedback_store 
-            if f.recommendation_id == recommendation_id
-        ]
+        feedback_list = self._feedback_by_recommendation.get(recommendation_id, [])
         
         if not feedback_list:
             return {
@@ -199,25 +209,23 @@ class RecommendationService:
                 "average_rating": None
             }
         
-        times_applied = sum(1 for f in feedback_list if f.was_applied)
-        successful_applications = sum(1 for f in feedback_list if f.was_successful)
-        
-        rating_values = {
-            "very_helpful": 4,
-            "helpful": 3,
-            "somewhat_helpful": 2,
-            "not_helpful": 1
-        }
-        
-        ratings = [rating_values[f.rating.value] for f in feedback_list]
-        avg_rating = sum(ratings) / len(ratings) if ratings else None
+        # Single pass over the feedback for all counters
+        times_applied = 0
+        successful_applications = 0
+        rating_total = 0
+        for f in feedback_list:
+            if f.was_applied:
+                times_applied += 1
+            if f.was_successful:
+                successful_applications += 1
+            rating_total += _RATING_SCORES[f.rating]
         
         return {
             "recommendation_id": recommendation_id,
             "total_feedback": len(feedback_list),
             "times_applied": times_applied,
             "success_rate": successful_applications / times_applied if times_applied > 0 else 0.0,
-            "average_rating": avg_rating
+            "average_rating": rating_total / len(feedback_list)
         }
     
     async def _fetch_recommendations(
@@ -238,19 +246,31 @@ class RecommendationService:
         # Stub implementation: Return category-based recommendations
         recommendations = self._get_category_recommendations(incident.category)
         
-        # Filter by success rate
-        filtered = [r for r in recommendations if r.success_rate >= min_success_rate]
-        
-        # Sort by success rate and confidence
-        filtered.sort(key=lambda r: (r.success_rate, r.confidence_score), reverse=True)
-        
-        # Limit to max_recommendations
-        return filtered[:max_recommendations]
+        # Keep the top max_recommendations by success rate and confidence
+        # without fully sorting every candidate
+        return heapq.nlargest(
+            max_recommendations,
+            (r for r in recommendations if r.success_rate >= min_success_rate),
+            key=lambda r: (r.success_rate, r.confidence_score)
+        )
     
     def _get_category_recommendations(self, category: IncidentCategory) -> List[ResolutionRecommendation]:
         """
         Get predefined recommendations for a category.
         
+        Returns deep copies so callers can modify a response without
+        touching the seeded catalogue or other responses.
+        """
+        now = datetime.utcnow()
+        return [
+            r.model_copy(deep=True, update={"created_at": now})
+            for r in self._historical_recommendations.get(category, [])
+        ]
+    
+    def _seed_historical_recommendations(self) -> Dict[IncidentCategory, List[ResolutionRecommendation]]:
+        """
+        Build the predefined recommendations for each category once at startup.
+        
         This is a stub - in production, this would query a recommendation database
         populated by ML models analyzing historical incident data.
         """
@@ -361,7 +381,7 @@ class RecommendationService:
             ]
         }
         
-        return recommendations_map.get(category, [])
+        return recommendations_map
     
     async def _update_recommendation_stats(
         self,
@@ -2,8 +2,9 @@
 Reporting service for generating analytics and reports.
 """
 import logging
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
 from uuid import uuid4
 
 from src.models.report import (
@@ -15,6 +16,18 @@ from src.services.audit_service import AuditService
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of closed-window reports kept in memory
+_REPORT_CACHE_SIZE = 64
+
+# Look-back window for each relative time range
+_TIME_RANGE_DELTAS = {
+    TimeRange.LAST_24_HOURS: timedelta(hours=24),
+    TimeRange.LAST_7_DAYS: timedelta(days=7),
+    TimeRange.LAST_30_DAYS: timedelta(days=30),
+    TimeRange.LAST_90_DAYS: timedelta(days=90)
+}
+_DEFAULT_TIME_RANGE_DELTA = timedelta(days=7)
+
 
 class ReportingService:
     """
@@ -35,6 +48,8 @@ class ReportingService:
             audit_service: Audit service for accessing historical data
         """
         self.audit_service = audit_service
+        # Reports over fixed (custom) windows are reused for repeat requests
+        self._report_cache: "OrderedDict[Tuple, ReportResponse]" = OrderedDict()
     
     async def generate_report(self, request: ReportRequest) -> ReportResponse:
         """
@@ -46,7 +61,7 @@ class ReportingService:
         Returns:
             Generated report with relevant data
         """
-        logger.info(f"Generating report: {request.report_type.value}")
+        logger.info("Generating report: %s", request.report_type.value)
         
         # Calculate date range
         start_date, end_date = self._calculate_date_range(
@@ -55,6 +70,26 @@ class ReportingService:
             request.end_date
         )
         
+        # Relative windows move with the clock and custom windows reaching
+        # into the future still collect events, so only closed custom
+        # windows are reusable. The audit log version invalidates entries
+        # whenever new history is recorded.
+        cache_key = None
+        if request.time_range == TimeRange.CUSTOM and end_date < self._now_like(end_date):
+            cache_key = (
+                request.report_type,
+                start_date,
+                end_date,
+                request.category_filter,
+                request.priority_filter,
+                self.audit_service.version
+            )
+            cached = self._report_cache.get(cache_key)
+            if cached is not None:
+                self._report_cache.move_to_end(cache_key)
+                logger.info("Returning cached report: %s", cached.report_id)
+                return cached.model_copy(deep=True)
+        
         # Generate report based on type
         report_data = {}
         
@@ -93,9 +128,20 @@ class ReportingService:
             }
         )
         
-        logger.info(f"Report generated: {response.report_id}")
+        if cache_key is not None:
+            self._report_cache[cache_key] = response.model_copy(deep=True)
+            if len(self._report_cache) > _REPORT_CACHE_SIZE:
+                self._report_cache.popitem(last=False)
+        
+        logger.info("Report generated: %s", response.report_id)
         return response
     
+    def _now_like(self, reference: datetime) -> datetime:
+        """Current UTC time, timezone-aware only if ``reference`` is."""
+        if reference.tzinfo is not None:
+            return datetime.now(timezone.utc)
+        return datetime.utcnow()
+    
     def _calculate_date_range(
         self,
         time_range: TimeRange,
@@ -110,19 +156,7 @@ class ReportingService:
                 raise ValueError("Custom time range requires start_date and end_date")
             return start_date, end_date
         
-        elif time_range == TimeRange.LAST_24_HOURS:
-            return now - timedelta(hours=24), now
-        
-        elif time_range == TimeRange.LAST_7_DAYS:
-            return now - timedelta(days=7), now
-        
-        elif time_range == TimeRange.LAST_30_DAYS:
-            return now - timedelta(days=30), now
-        
-        elif time_range == TimeRange.LAST_90_DAYS:
-            return now - timedelta(days=90), now
-        
-        return now - timedelta(days=7), now
+        return now - _TIME_RANGE_DELTAS.get(time_range, _DEFAULT_TIME_RANGE_DELTA), now
     
     async def _generate_resolution_summary(
         self,
@@ -139,7 +173,7 @@ class ReportingService:
         - Compute average confidence scores
         - Calculate average resolution times
         """
-        logger.info(f"Generating resolution summary from {start_date} to {end_date}")
+        logger.info("Generating resolution summary from %s to %s", start_date, end_date)
         
         # Stub implementation - replace with actual data queries
         return ResolutionSummary(
@@ -166,7 +200,7 @@ class ReportingService:
         - Calculate daily incident counts
         - Determine trend direction (increasing/decreasing/stable)
         """
-        logger.info(f"Generating incident trends from {start_date} to {end_date}")
+        logger.info("Generating incident trends from %s to %s", start_date, end_date)
         
         # Stub implementation - replace with actual data queries
         return IncidentTrends(
@@ -191,7 +225,7 @@ class ReportingService:
         - Compute average response times
         - Track kill switch activations
         """
-        logger.info(f"Generating performance metrics from {start_date} to {end_date}")
+        logger.info("Generating performance metrics from %s to %s", start_date, end_date)
         
         # Stub implementation - replace with actual data queries
         return PerformanceMetrics(
@@ -217,7 +251,7 @@ class ReportingService:
         - Compute average ratings
         - Determine coverage rate (75% target)
         """
-        logger.info(f"Generating recommendation effectiveness from {start_date} to {end_date}")
+        logger.info("Generating recommendation effectiveness from %s to %s", start_date, end_date)
         
         # Stub implementation - replace with actual data queries
         return RecommendationEffectiveness(
@@ -0,0 +1,121 @@
+"""
+Unit tests for audit service.
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID
+
+from src.models.audit import AuditAction, AuditQuery
+from src.services.audit_service import AuditService
+
+
+@pytest.fixture
+def audit_service():
+    """Create audit service fixture."""
+    return AuditService()
+
+
+@pytest.mark.asyncio
+async def test_query_audit_log_date_window(audit_service):
+    """Test that date filters return only entries inside the window, newest first."""
+    entries = [
+        await audit_service.log_auto_resolution_attempt(f"INC-AUD-{i}", 0.9)
+        for i in range(5)
+    ]
+
+    start_date = entries[1].timestamp
+    end_date = entries[3].timestamp
+
+    results = await audit_service.query_audit_log(AuditQuery(
+        start_date=start_date,
+        end_date=end_date
+    ))
+
+    expected = [
+        e.audit_id for e in sorted(entries, key=lambda e: e.timestamp, reverse=True)
+        if start_date <= e.timestamp <= end_date
+    ]
+    assert [e.audit_id for e in results] == expected
+    assert entries[2].audit_id in expected
+
+
+@pytest.mark.asyncio
+async def test_query_audit_log_filters_and_pagination(audit_service):
+    """Test incident/action filters combined with offset and limit."""
+    for _ in range(3):
+        await audit_service.log_auto_resolution_attempt("INC-AUD-A", 0.9)
+        await audit_service.log_auto_resolution_attempt("INC-AUD-B", 0.9)
+    await audit_service.log_auto_resolution_failed("INC-AUD-A", 0.9, "boom")
+
+    results = await audit_service.query_audit_log(AuditQuery(
+        incident_id="INC-AUD-A",
+        action=AuditAction.AUTO_RESOLUTION_ATTEMPTED,
+        offset=1,
+        limit=5
+    ))
+
+    assert len(results) == 2
+    assert all(e.incident_id == "INC-AUD-A" for e in results)
+    assert all(e.action == AuditAction.AUTO_RESOLUTION_ATTEMPTED for e in results)
+
+
+@pytest.mark.asyncio
+async def test_query_audit_log_window_outside_log(audit_service):
+    """Test that a window with no entries returns nothing."""
+    entry = await audit_service.log_auto_resolution_attempt("INC-AUD-C", 0.9)
+
+    results = await audit_service.query_audit_log(AuditQuery(
+        end_date=entry.timestamp - timedelta(days=1)
+    ))
+
+    assert results == []
+
+
+@pytest.mark.asyncio
+async def test_query_audit_log_keeps_insertion_order_for_tied_timestamps(audit_service):
+    """Test that entries sharing a timestamp come back in insertion order."""
+    batch = await audit_service.log_notifications_sent_bulk([
+        (f"INC-AUD-T{i}", "user", "auto_resolution") for i in range(3)
+    ])
+
+    results = await audit_service.query_audit_log(AuditQuery())
+
+    assert len({e.timestamp for e in batch}) == 1
+    assert [e.audit_id for e in results] == [e.audit_id for e in batch]
+
+
+@pytest.mark.asyncio
+async def test_query_audit_log_survives_clock_stepping_back(audit_service):
+    """Test that entries logged after the wall clock steps back keep their real time."""
+    first_time = datetime(2024, 1, 1, 10, 0, 0)
+    stepped_back = first_time - timedelta(hours=1)
+    with patch("src.services.audit_service.datetime") as mock_datetime:
+        mock_datetime.utcnow.return_value = first_time
+        first = await audit_service.log_auto_resolution_attempt("INC-AUD-E", 0.9)
+        mock_datetime.utcnow.return_value = stepped_back
+        second = await audit_service.log_auto_resolution_attempt("INC-AUD-F", 0.9)
+        third = await audit_service.log_auto_resolution_attempt("INC-AUD-F", 0.9)
+
+    assert second.timestamp == stepped_back
+
+    window = await audit_service.query_audit_log(AuditQuery(
+        start_date=stepped_back,
+        end_date=stepped_back + timedelta(minutes=1)
+    ))
+    assert [e.audit_id for e in window] == [second.audit_id, third.audit_id]
+
+    everything = await audit_service.query_audit_log(AuditQuery())
+    assert [e.audit_id for e in everything] == [
+        first.audit_id, second.audit_id, third.audit_id
+    ]
+
+
+@pytest.mark.asyncio
+async def test_audit_ids_are_version_4_uuids(audit_service):
+    """Test that audit identifiers are canonical, valid v4 UUIDs."""
+    for _ in range(50):
+        entry = await audit_service.log_auto_resolution_attempt("INC-AUD-G", 0.9)
+        parsed = UUID(entry.audit_id)
+        assert parsed.version == 4
+        assert str(parsed) == entry.audit_id
@@ -0,0 +1,90 @@
+"""
+Unit tests for the headless business logic agent.
+"""
+import asyncio
+import pytest
+
+from src.bl_agent import create_agent
+from src.models.audit import AuditAction
+from src.models.incident import Incident, IncidentCategory, IncidentPriority
+
+
+@pytest.fixture
+def agent():
+    """Create agent fixture with steps that yield to the event loop."""
+    agent = create_agent()
+
+    async def yielding_step(step, incident):
+        # Stand-in for remediation I/O
+        await asyncio.sleep(0)
+
+    agent.auto_resolution._execute_step = yielding_step
+    return agent
+
+
+def make_incident(incident_id: str) -> Incident:
+    """Build a high-confidence incident."""
+    return Incident(
+        incident_id=incident_id,
+        title="Database connection pool exhausted",
+        description="Application cannot connect to database",
+        category=IncidentCategory.DATABASE,
+        priority=IncidentPriority.HIGH,
+        confidence_score=0.95,
+        created_by="user123"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_resolve_incidents(agent):
+    """Test that distinct incidents are all resolved, in input order."""
+    incidents = [make_incident(f"INC-BULK-{i}") for i in range(3)]
+
+    responses = await agent.bulk_resolve_incidents(incidents)
+
+    assert [r.incident_id for r in responses] == [i.incident_id for i in incidents]
+    assert all(r.success for r in responses)
+
+
+@pytest.mark.asyncio
+async def test_bulk_resolve_duplicate_incident_resolved_once(agent):
+    """Test that the same incident listed twice is only auto-resolved once."""
+    incident = make_incident("INC-BULK-DUP")
+
+    responses = await agent.bulk_resolve_incidents([incident, incident])
+
+    assert [r.success for r in responses] == [True, False]
+    assert "already in status" in responses[1].message
+
+    trail = await agent.get_audit_log(incident.incident_id)
+    successes = [e for e in trail if e.action == AuditAction.AUTO_RESOLUTION_SUCCESS]
+    assert len(successes) == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_resolve_sends_one_notification_batch(agent):
+    """Test that bulk resolution notifies creators through a single bulk send."""
+    bulk_calls = []
+    single_calls = []
+
+    async def record_bulk(notifications):
+        bulk_calls.append(notifications)
+
+    async def record_single(incident, resolution_steps):
+        single_calls.append(incident.incident_id)
+        return True
+
+    agent.notification_service._send_notifications_bulk = record_bulk
+    agent.notification_service.notify_auto_resolution = record_single
+    incidents = [make_incident(f"INC-BULK-N{i}") for i in range(3)]
+
+    await agent.bulk_resolve_incidents(incidents)
+
+    assert single_calls == []
+    assert len(bulk_calls) == 1
+    assert [recipient for recipient, _, _ in bulk_calls[0]] == ["user123"] * 3
+    sent = [
+        e for e in agent.audit_service._audit_log
+        if e.action == AuditAction.NOTIFICATION_SENT
+    ]
+    assert sorted(e.incident_id for e in sent) == sorted(i.incident_id for i in incidents)
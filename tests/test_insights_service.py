@@ -0,0 +1,76 @@
+"""
+Unit tests for insights service.
+"""
+import pytest
+from pydantic import ValidationError
+
+from src.models.insight import AnomalyThresholdConfig, InsightsRequest, ServiceArea
+from src.services.insights_service import InsightsService
+
+
+@pytest.fixture
+def insights_service():
+    """Create insights service fixture."""
+    return InsightsService()
+
+
+@pytest.mark.asyncio
+async def test_generated_insights_pass_model_validation(insights_service):
+    """
+    Test that generated models satisfy their field constraints.
+    
+    Trends and predictions are built with model_construct, which skips
+    validation, and InsightsResponse does not revalidate nested instances,
+    so the generators themselves must stay within bounds.
+    """
+    for _ in range(20):
+        response = await insights_service.generate_insights(
+            InsightsRequest(time_period_days=1)
+        )
+        
+        generated = [*response.trends, *response.anomalies, *response.predictions]
+        assert generated
+        for model in generated:
+            type(model).model_validate(model.model_dump())
+
+
+@pytest.mark.asyncio
+async def test_user_configured_thresholds_produce_valid_anomalies(insights_service):
+    """Test anomalies from user thresholds stay valid, and invalid ones are rejected."""
+    await insights_service.configure_threshold(AnomalyThresholdConfig(
+        service_area=ServiceArea.NETWORK,
+        metric_name="response_time_ms",
+        threshold_value=1.0,
+        threshold_type="absolute"
+    ))
+    request = InsightsRequest(
+        service_areas=[ServiceArea.NETWORK],
+        include_trends=False,
+        include_predictions=False
+    )
+    
+    response = await insights_service.generate_insights(request)
+    
+    assert response.anomalies
+    for anomaly in response.anomalies:
+        assert 0.0 <= anomaly.severity <= 1.0
+    
+    await insights_service.configure_threshold(AnomalyThresholdConfig(
+        service_area=ServiceArea.NETWORK,
+        metric_name="response_time_ms",
+        threshold_value=-100.0,
+        threshold_type="absolute"
+    ))
+    
+    with pytest.raises(ValidationError):
+        await insights_service.generate_insights(request)
+
+
+@pytest.mark.asyncio
+async def test_generate_insights_defaults_to_all_service_areas(insights_service):
+    """Test that omitting service areas analyzes every area."""
+    response = await insights_service.generate_insights(
+        InsightsRequest(include_anomalies=False, include_predictions=False)
+    )
+    
+    assert {t.service_area for t in response.trends} == set(ServiceArea)
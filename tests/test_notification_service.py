@@ -0,0 +1,82 @@
+"""
+Unit tests for notification service.
+"""
+import pytest
+
+from src.models.audit import AuditAction
+from src.models.incident import (
+    Incident, IncidentCategory, IncidentPriority, ResolutionStep
+)
+from src.services.audit_service import AuditService
+from src.services.notification_service import NotificationService
+
+
+@pytest.fixture
+def audit_service():
+    """Create audit service fixture."""
+    return AuditService()
+
+
+@pytest.fixture
+def notification_service(audit_service):
+    """Create notification service fixture."""
+    return NotificationService(audit_service=audit_service)
+
+
+def make_resolution(index: int):
+    """Build an incident and its resolution steps."""
+    incident = Incident(
+        incident_id=f"INC-NOT-{index}",
+        title=f"Notification test incident {index}",
+        description="Test description",
+        category=IncidentCategory.NETWORK,
+        priority=IncidentPriority.MEDIUM,
+        confidence_score=0.95,
+        created_by=f"user-{index}"
+    )
+    steps = [
+        ResolutionStep(
+            step_id=f"step-{index}",
+            description="Restart network service",
+            action="restart_service",
+            success=True
+        )
+    ]
+    return incident, steps
+
+
+@pytest.mark.asyncio
+async def test_notify_auto_resolution_batch(notification_service, audit_service):
+    """Test that a batch notifies every incident and audits each send."""
+    resolutions = [make_resolution(i) for i in range(3)]
+
+    results = await notification_service.notify_auto_resolution_batch(resolutions)
+
+    assert results == [True, True, True]
+    sent = [e for e in audit_service._audit_log if e.action == AuditAction.NOTIFICATION_SENT]
+    assert [e.incident_id for e in sent] == [i.incident_id for i, _ in resolutions]
+    assert all(e.details["notification_type"] == "auto_resolution" for e in sent)
+
+
+@pytest.mark.asyncio
+async def test_notify_auto_resolution_batch_empty(notification_service, audit_service):
+    """Test that an empty batch sends nothing."""
+    assert await notification_service.notify_auto_resolution_batch([]) == []
+    assert audit_service._audit_log == []
+
+
+@pytest.mark.asyncio
+async def test_notify_auto_resolution_batch_single_uses_direct_send(notification_service, audit_service):
+    """Test that a batch of one takes the single-send path."""
+    bulk_calls = []
+
+    async def record_bulk(notifications):
+        bulk_calls.append(notifications)
+
+    notification_service._send_notifications_bulk = record_bulk
+
+    results = await notification_service.notify_auto_resolution_batch([make_resolution(0)])
+
+    assert results == [True]
+    assert bulk_calls == []
+    assert [e.incident_id for e in audit_service._audit_log] == ["INC-NOT-0"]
@@ -97,6 +97,38 @@ async def test_recommendations_ranked_by_success_rate(recommendation_service, da
         assert recommendations[i].success_rate >= recommendations[i + 1].success_rate
 
 
+@pytest.mark.asyncio
+async def test_recommendation_ids_stable_across_requests(recommendation_service, network_incident):
+    """Test that repeat requests return the same recommendation identifiers."""
+    first = await recommendation_service.get_recommendations(incident=network_incident)
+    second = await recommendation_service.get_recommendations(incident=network_incident)
+    
+    assert [r.recommendation_id for r in first.recommendations] == [
+        r.recommendation_id for r in second.recommendations
+    ]
+
+
+@pytest.mark.asyncio
+async def test_recommendation_responses_do_not_share_state(recommendation_service, network_incident):
+    """Test that modifying one response does not leak into later requests."""
+    first = await recommendation_service.get_recommendations(incident=network_incident)
+    edited = first.recommendations[0]
+    edited.status = RecommendationStatus.APPLIED
+    edited.times_suggested += 1000
+    edited.steps.append("Injected step")
+    
+    second = await recommendation_service.get_recommendations(incident=network_incident)
+    fresh = next(
+        r for r in second.recommendations
+        if r.recommendation_id == edited.recommendation_id
+    )
+    
+    assert fresh is not edited
+    assert fresh.status != RecommendationStatus.APPLIED
+    assert fresh.times_suggested == edited.times_suggested - 1000
+    assert "Injected step" not in fresh.steps
+
+
 @pytest.mark.asyncio
 async def test_recommendations_include_steps(recommendation_service, network_incident):
     """Test that recommendations include step-by-step instructions."""
@@ -228,6 +260,33 @@ async def test_get_feedback_stats(recommendation_service):
     assert stats["success_rate"] == 1.0
 
 
+@pytest.mark.asyncio
+async def test_get_feedback_stats_isolated_per_recommendation(recommendation_service):
+    """Test that statistics only include feedback for the requested recommendation."""
+    for recommendation_id, rating in [
+        ("rec-iso-001", FeedbackRating.VERY_HELPFUL),
+        ("rec-iso-002", FeedbackRating.NOT_HELPFUL),
+        ("rec-iso-002", FeedbackRating.NOT_HELPFUL),
+    ]:
+        await recommendation_service.submit_feedback(FeedbackRequest(
+            recommendation_id=recommendation_id,
+            incident_id="INC-ISO-001",
+            engineer_id="engineer789",
+            rating=rating,
+            was_applied=True,
+            was_successful=rating == FeedbackRating.VERY_HELPFUL
+        ))
+
+    stats = await recommendation_service.get_feedback_stats("rec-iso-001")
+    assert stats["total_feedback"] == 1
+    assert stats["average_rating"] == 4
+    assert stats["success_rate"] == 1.0
+
+    empty_stats = await recommendation_service.get_feedback_stats("rec-iso-unknown")
+    assert empty_stats["total_feedback"] == 0
+    assert empty_stats["average_rating"] is None
+
+
 @pytest.mark.asyncio
 async def test_get_feedback_for_incident(recommendation_service):
     """Test retrieving all feedback for a specific incident."""
@@ -2,7 +2,7 @@
 Tests for the reporting service.
 """
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from src.services.reporting_service import ReportingService
 from src.services.audit_service import AuditService
@@ -109,6 +109,93 @@ class TestReportingService:
         assert report.start_date == start_date
         assert report.end_date == end_date
     
+    @pytest.mark.asyncio
+    async def test_custom_date_range_report_is_cached(self, reporting_service):
+        """Test that repeat requests for a closed custom range reuse the report."""
+        request = ReportRequest(
+            report_type=ReportType.RESOLUTION_SUMMARY,
+            time_range=TimeRange.CUSTOM,
+            start_date=datetime.utcnow() - timedelta(days=14),
+            end_date=datetime.utcnow() - timedelta(days=1)
+        )
+        
+        first = await reporting_service.generate_report(request)
+        first.metadata["category_filter"] = "edited"
+        second = await reporting_service.generate_report(request)
+        
+        assert second.report_id == first.report_id
+        assert second is not first
+        assert second.metadata["category_filter"] is None
+    
+    @pytest.mark.asyncio
+    async def test_timezone_aware_custom_range_report_is_cached(self, reporting_service):
+        """Test that timezone-aware custom ranges are accepted and cached."""
+        now = datetime.now(timezone.utc)
+        request = ReportRequest(
+            report_type=ReportType.RESOLUTION_SUMMARY,
+            time_range=TimeRange.CUSTOM,
+            start_date=now - timedelta(days=14),
+            end_date=now - timedelta(days=1)
+        )
+        
+        first = await reporting_service.generate_report(request)
+        second = await reporting_service.generate_report(request)
+        
+        assert first.end_date == request.end_date
+        assert second.report_id == first.report_id
+        
+        open_request = request.copy(update={"end_date": now + timedelta(days=1)})
+        third = await reporting_service.generate_report(open_request)
+        fourth = await reporting_service.generate_report(open_request)
+        
+        assert fourth.report_id != third.report_id
+    
+    @pytest.mark.asyncio
+    async def test_open_custom_range_report_not_cached(self, reporting_service):
+        """Test that a custom range ending in the future is always regenerated."""
+        request = ReportRequest(
+            report_type=ReportType.RESOLUTION_SUMMARY,
+            time_range=TimeRange.CUSTOM,
+            start_date=datetime.utcnow() - timedelta(days=14),
+            end_date=datetime.utcnow() + timedelta(days=1)
+        )
+        
+        first = await reporting_service.generate_report(request)
+        second = await reporting_service.generate_report(request)
+        
+        assert second.report_id != first.report_id
+    
+    @pytest.mark.asyncio
+    async def test_cached_report_invalidated_by_new_audit_entries(
+        self, reporting_service, audit_service
+    ):
+        """Test that recording new audit history invalidates cached reports."""
+        request = ReportRequest(
+            report_type=ReportType.RESOLUTION_SUMMARY,
+            time_range=TimeRange.CUSTOM,
+            start_date=datetime.utcnow() - timedelta(days=14),
+            end_date=datetime.utcnow() - timedelta(days=1)
+        )
+        
+        first = await reporting_service.generate_report(request)
+        await audit_service.log_auto_resolution_attempt("INC-RPT-001", 0.95)
+        second = await reporting_service.generate_report(request)
+        
+        assert second.report_id != first.report_id
+    
+    @pytest.mark.asyncio
+    async def test_relative_range_report_not_cached(self, reporting_service):
+        """Test that relative time ranges always generate a fresh report."""
+        request = ReportRequest(
+            report_type=ReportType.RESOLUTION_SUMMARY,
+            time_range=TimeRange.LAST_7_DAYS
+        )
+        
+        first = await reporting_service.generate_report(request)
+        second = await reporting_service.generate_report(request)
+        
+        assert second.report_id != first.report_id
+    
     @pytest.mark.asyncio
     async def test_custom_date_range_missing_dates(self, reporting_service):
         """Test that custom date range without dates raises error."""